@@ -23,16 +23,51 @@ diffeq
     Probabilistic solvers for ordinary differential equations.
 """
 # -*- coding: utf-8 -*-
-from pkg_resources import DistributionNotFound, get_distribution
+import importlib as _importlib
+import sys as _sys
 
-from . import diffeq, filtsmooth, linalg, linops, quad, random_variables, utils
+from . import linops, random_variables, utils
 from .random_variables import RandomVariable, asrandvar
 
+# Subpackages which are only imported on first access, since some of them pull in
+# expensive dependencies (e.g. GPy for `linalg`)
+_LAZY_SUBPACKAGES = ("diffeq", "filtsmooth", "linalg", "quad")
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBPACKAGES:
+        module = _importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBPACKAGES))
+
+
+if _sys.version_info < (3, 7):
+    # Module-level `__getattr__` (PEP 562) is only supported from Python 3.7 on
+    from . import diffeq, filtsmooth, linalg, quad
+
+try:
+    # `importlib.metadata` is only available in Python >=3.8 and much faster to
+    # import than `pkg_resources`
+    from importlib.metadata import PackageNotFoundError as DistributionNotFound
+    from importlib.metadata import version as _get_version
+except ImportError:
+    from pkg_resources import DistributionNotFound, get_distribution
+
+    def _get_version(dist_name):
+        return get_distribution(dist_name).version
+
+
 try:
     # Change here if project is renamed and does not equal the package name
     dist_name = __name__
-    __version__ = get_distribution(dist_name).version
+    __version__ = _get_version(dist_name)
 except DistributionNotFound:
     __version__ = "unknown"
 finally:
-    del get_distribution, DistributionNotFound
+    del _get_version, DistributionNotFound
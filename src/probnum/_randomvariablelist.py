@@ -1,12 +1,28 @@
+import functools
+
 import numpy as np
 
 import probnum.random_variables as pnrvs
 
 
+def _invalidates_cache(method):
+    """Wrap a mutating list method such that it invalidates cached moments."""
+
+    @functools.wraps(method)
+    def _wrapped(self, *args, **kwargs):
+        self._invalidate_cache()
+        return method(self, *args, **kwargs)
+
+    return _wrapped
+
+
 class _RandomVariableList(list):
     """
     List of RandomVariables with convenient access to means, covariances, etc.
 
+    The stacked moments are cached. The cache is invalidated by any operation that
+    mutates the list.
+
     Parameters
     ----------
     rv_list : :obj:`list` of :obj:`RandomVariable`
@@ -21,25 +37,100 @@ class _RandomVariableList(list):
             raise TypeError("RandomVariableList expects RandomVariable elements")
         super().__init__(rv_list)
 
+        self._version = 0
+        self._cache = {}
+
     @property
     def mean(self):
-        return np.stack([rv.mean for rv in self])
+        return self._stack_moment("mean")
 
     @property
     def cov(self):
-        return np.stack([rv.cov for rv in self])
+        return self._stack_moment("cov")
 
     @property
     def var(self):
-        return np.stack([rv.var for rv in self])
+        return self._stack_moment("var")
 
     @property
     def std(self):
-        return np.stack([rv.std for rv in self])
+        """Standard deviations, computed in a single vectorized operation from the
+        stacked variances."""
+        key = ("std", self._version)
+        if key in self._cache:
+            return self._cache[key]
+
+        var = self.var
+
+        if var.ndim > 0 and var.strides[0] == 0:
+            # The variance is shared by all random variables
+            std = np.broadcast_to(np.sqrt(var[0]), var.shape)
+        else:
+            std = np.sqrt(var)
+            std.setflags(write=False)
+
+        self._cache[key] = std
+        return std
+
+    def _stack_moment(self, name):
+        """Stack a moment of all random variables along a new first axis.
+
+        If all random variables share the very same moment object, e.g. a constant
+        covariance along a trajectory, a read-only broadcast view of it is returned
+        instead of a copy. Otherwise, the output array is allocated once, based on
+        the shape and dtype of the moment of the first element, and filled row by
+        row. This avoids the additional copy of ``np.stack``.
+        """
+        key = (name, self._version)
+        if key in self._cache:
+            return self._cache[key]
+
+        moments = [getattr(rv, name) for rv in self]
+        first = moments[0]
+
+        if all(moment is first for moment in moments):
+            stacked = np.broadcast_to(first, (len(self),) + np.shape(first))
+        else:
+            stacked = np.empty(
+                (len(self),) + np.shape(first), dtype=np.asarray(first).dtype
+            )
+            for idx, moment in enumerate(moments):
+                # Assignment would broadcast mismatching moments into the row
+                if np.shape(moment) != np.shape(first):
+                    raise ValueError(
+                        f"The {name} of all random variables must have the same "
+                        f"shape, but got {np.shape(first)} and {np.shape(moment)}."
+                    )
+                stacked[idx] = moment
+
+            # Make immutable, since the array is shared between calls
+            stacked.setflags(write=False)
+
+        self._cache[key] = stacked
+        return stacked
+
+    def _invalidate_cache(self):
+        # Use `getattr` since unpickling appends elements before restoring `__dict__`
+        self._version = getattr(self, "_version", 0) + 1
+        self._cache = {}
+
+    append = _invalidates_cache(list.append)
+    extend = _invalidates_cache(list.extend)
+    insert = _invalidates_cache(list.insert)
+    pop = _invalidates_cache(list.pop)
+    remove = _invalidates_cache(list.remove)
+    clear = _invalidates_cache(list.clear)
+    sort = _invalidates_cache(list.sort)
+    reverse = _invalidates_cache(list.reverse)
+    __setitem__ = _invalidates_cache(list.__setitem__)
+    __delitem__ = _invalidates_cache(list.__delitem__)
+    __iadd__ = _invalidates_cache(list.__iadd__)
+    __imul__ = _invalidates_cache(list.__imul__)
 
     def __getitem__(self, idx):
         """Make sure to wrap the result into a _RandomVariableList if necessary"""
-        result = super().__getitem__(idx)
-        if isinstance(result, list):
-            result = _RandomVariableList(result)
-        return result
+        # Only slicing returns a list, so integer indexing goes straight to the
+        # list implementation
+        if isinstance(idx, slice):
+            return _RandomVariableList(list.__getitem__(self, idx))
+        return list.__getitem__(self, idx)
@@ -4,6 +4,7 @@ Gaussian filtering.
 from abc import ABC, abstractmethod
 
 import numpy as np
+import scipy.linalg
 
 from probnum._randomvariablelist import _RandomVariableList
 from probnum.filtsmooth.bayesfiltsmooth import BayesFiltSmooth
@@ -198,9 +199,10 @@ class GaussFiltSmooth(BayesFiltSmooth, ABC):
         if np.isscalar(predmean) and np.isscalar(predcov):
             predmean = predmean * np.ones(1)
             predcov = predcov * np.eye(1)
-        newmean = initmean + crosscov @ np.linalg.solve(predcov, currmean - predmean)
-        firstsolve = crosscov @ np.linalg.solve(predcov, currcov - predcov)
-        secondsolve = crosscov @ np.linalg.solve(predcov, firstsolve.T)
+        predcov_solve = _cov_solver(predcov)
+        newmean = initmean + crosscov @ predcov_solve(currmean - predmean)
+        firstsolve = crosscov @ predcov_solve(currcov - predcov)
+        secondsolve = crosscov @ predcov_solve(firstsolve.T)
         newcov = initcov + secondsolve.T
         return Normal(newmean, newcov)
 
@@ -215,8 +217,27 @@ class GaussFiltSmooth(BayesFiltSmooth, ABC):
 
 def linear_discrete_update(meanest, cpred, data, meascov, measmat, mpred):
     """Kalman update, potentially after linearization."""
-    covest = measmat @ cpred @ measmat.T + meascov
     ccest = cpred @ measmat.T
-    mean = mpred + ccest @ np.linalg.solve(covest, data - meanest)
-    cov = cpred - ccest @ np.linalg.solve(covest.T, ccest.T)
+    covest = measmat @ ccest
+    covest += meascov
+    covest_solve = _cov_solver(covest)
+    mean = mpred + ccest @ covest_solve(data - meanest)
+    cov = ccest @ covest_solve(ccest.T)
+    cov = np.subtract(cpred, cov, out=cov)
     return Normal(mean, cov), covest, ccest, meanest
+
+
+def _cov_solver(cov):
+    """Factorize a covariance matrix once and return a function which solves linear
+    systems with it.
+
+    The Cholesky factorization is used, which reduces every subsequent solve to two
+    triangular solves. If the matrix is not numerically positive definite, we fall
+    back to LU-based solves.
+    """
+    try:
+        cov_cho_factor = scipy.linalg.cho_factor(cov, lower=True)
+    except np.linalg.LinAlgError:
+        return lambda rhs: np.linalg.solve(cov, rhs)
+
+    return lambda rhs: scipy.linalg.cho_solve(cov_cho_factor, rhs)
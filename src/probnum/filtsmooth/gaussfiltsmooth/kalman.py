@@ -107,7 +107,8 @@ class _DiscDiscKalman(Kalman):
         diffmat = self.dynamicmodel.diffusionmatrix(start, **kwargs)
         mpred = dynamat @ mean + forcevec
         ccpred = covar @ dynamat.T
-        cpred = dynamat @ ccpred + diffmat
+        cpred = dynamat @ ccpred
+        cpred += diffmat
         return Normal(mpred, cpred), {"crosscov": ccpred}
 
     def update(self, time, randvar, data, **kwargs):
@@ -9,6 +9,7 @@ import numpy as np
 
 from probnum.filtsmooth.gaussfiltsmooth.gaussfiltsmooth import (
     GaussFiltSmooth,
+    _cov_solver,
     linear_discrete_update,
 )
 from probnum.filtsmooth.gaussfiltsmooth.unscentedtransform import UnscentedTransform
@@ -174,6 +175,7 @@ def _update_discrete_nonlinear(time, randvar, data, measmod, ut, **kwargs):
     proppts = ut.propagate(time, sigmapts, measmod.dynamics)
     meascov = measmod.diffusionmatrix(time, **kwargs)
     meanest, covest, ccest = ut.estimate_statistics(proppts, sigmapts, meascov, mpred)
-    mean = mpred + ccest @ np.linalg.solve(covest, data - meanest)
-    cov = cpred - ccest @ np.linalg.solve(covest.T, ccest.T)
+    covest_solve = _cov_solver(covest)
+    mean = mpred + ccest @ covest_solve(data - meanest)
+    cov = cpred - ccest @ covest_solve(ccest.T)
     return Normal(mean, cov), covest, ccest, meanest
@@ -233,7 +233,8 @@ class LTISDEModel(LinearSDEModel):
         old_mean, old_cov = rv.mean, rv.cov
         new_mean = disc_dynamics @ old_mean + disc_force
         new_crosscov = old_cov @ disc_dynamics.T
-        new_cov = disc_dynamics @ new_crosscov + disc_diffusion
+        new_cov = disc_dynamics @ new_crosscov
+        new_cov += disc_diffusion
         return Normal(mean=new_mean, cov=new_cov), {"crosscov": new_crosscov}
 
     def _discretise(self, step):
@@ -161,7 +161,8 @@ class DiscreteGaussianLinearModel(DiscreteGaussianModel):
 
         new_mean = dynamat @ rv.mean + force
         new_crosscov = rv.cov @ dynamat.T
-        new_cov = dynamat @ new_crosscov + diffmat
+        new_cov = dynamat @ new_crosscov
+        new_cov += diffmat
         return Normal(mean=new_mean, cov=new_cov), {"crosscov": new_crosscov}
 
     def dynamicsmatrix(self, time, **kwargs):
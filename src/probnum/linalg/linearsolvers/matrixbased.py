@@ -9,6 +9,7 @@ import warnings
 
 import GPy
 import numpy as np
+import scipy.linalg
 
 import probnum
 from probnum import linops
@@ -188,21 +189,20 @@ class MatrixBasedSolver(ProbabilisticLinearSolver, abc.ABC):
 
         # Construct prior mean of A and H
         alpha = 0.5 * bx0 / bb
+        u = x0 - alpha * b
 
+        # Apply the rank-1 term uu' without forming the (n x n) outer product
         def _mv(v):
-            return (x0 - alpha * b) * (x0 - alpha * b).T @ v
-
-        def _mm(M):
-            return (x0 - alpha * b) @ (x0 - alpha * b).T @ M
+            return u @ (u.T @ v)
 
         Ainv0_mean = linops.ScalarMult(
             scalar=alpha, shape=(self.n, self.n)
         ) + 2 / bx0 * linops.LinearOperator(
-            matvec=_mv, matmat=_mm, shape=(self.n, self.n)
+            matvec=_mv, matmat=_mv, shape=(self.n, self.n)
         )
         A0_mean = linops.ScalarMult(scalar=1 / alpha, shape=(self.n, self.n)) - 1 / (
-            alpha * np.squeeze((x0 - alpha * b).T @ x0)
-        ) * linops.LinearOperator(matvec=_mv, matmat=_mm, shape=(self.n, self.n))
+            alpha * np.squeeze(u.T @ x0)
+        ) * linops.LinearOperator(matvec=_mv, matmat=_mv, shape=(self.n, self.n))
         return A0_mean, Ainv0_mean
 
     def has_converged(self, iter, maxiter, **kwargs):
@@ -492,13 +492,22 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         else:
             # General prior mean
             if self.is_calib_covclass and k > 0 and unc_scale != 0:
-                # General prior mean with calibration covariance class
-                _trace = np.trace(
-                    np.linalg.solve(
-                        Y.T @ self.Ainv_mean0 @ Y,
-                        Y.T @ self.Ainv_mean0 @ self.Ainv_mean0 @ Y,
+                # General prior mean with calibration covariance class, where the
+                # Gram matrix Y'A_0^{-1}Y is symmetric positive definite in exact
+                # arithmetic. Computing Y'A_0^{-1}A_0^{-1}Y as (A_0^{-1}Y)'A_0^{-1}Y
+                # relies on the prior mean A_0^{-1} being symmetric.
+                Ainv0Y = self.Ainv_mean0 @ Y
+                YAinv0Y = Y.T @ Ainv0Y
+                YAinv0Ainv0Y = Ainv0Y.T @ Ainv0Y
+                try:
+                    _trace = np.trace(
+                        scipy.linalg.cho_solve(
+                            scipy.linalg.cho_factor(YAinv0Y), YAinv0Ainv0Y
+                        )
                     )
-                )
+                except np.linalg.LinAlgError:
+                    # Gram matrix is not numerically positive definite
+                    _trace = np.trace(np.linalg.solve(YAinv0Y, YAinv0Ainv0Y))
             else:
                 _trace = self.Ainv_covfactor0.trace()
         if self.is_calib_covclass:
@@ -656,15 +665,14 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
 
         return Phi, Psi
 
-    def _get_calibration_covariance_update_terms(self, phi=None, psi=None):
+    def _get_calibration_covariance_update_terms(self, Y, phi=None, psi=None):
         """
         For the calibration covariance class set the calibration update terms of the
         covariance in the null spaces of span(S) and span(Y) based on the degrees of
         freedom.
         """
-        # Search directions and observations as arrays
+        # Search directions as an array, observations are given as an array already
         S = np.hstack(self.search_dir_list)
-        Y = np.hstack(self.obs_list)
 
         def get_null_space_map(V, unc_scale):
             """
@@ -703,16 +711,18 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
         """
 
         if self.iter_ > 0:
-            # Observations and inner products in A-space between actions
-            Y = np.hstack(Y_list)
-            sy = np.vstack(sy_list).ravel()
-
             # Posterior covariance factors
             if self.is_calib_covclass and (not phi is None) and (not psi is None):
+                # Observations and inner products in A-space between actions, which
+                # are only assembled into arrays when the calibration terms need them
+                Y = np.hstack(Y_list)
+                sy = np.vstack(sy_list).ravel()
+                Y_sy = Y / sy
+
                 # Ensure prior covariance class only acts in span(S) like A
                 def _matvec(x):
                     # First term of calibration covariance class: AS(S'AS)^{-1}S'A
-                    return (Y * sy ** -1) @ (Y.T @ x.ravel())
+                    return Y_sy @ (Y.T @ x.ravel())
 
                 _A_covfactor0 = linops.LinearOperator(
                     shape=(self.n, self.n), matvec=_matvec
@@ -737,7 +747,7 @@ class SymmetricMatrixBasedSolver(MatrixBasedSolver):
                 (
                     calibration_term_A,
                     calibration_term_Ainv,
-                ) = self._get_calibration_covariance_update_terms(phi=phi, psi=psi)
+                ) = self._get_calibration_covariance_update_terms(Y=Y, phi=phi, psi=psi)
 
                 _A_covfactor = (
                     _A_covfactor0 - self._A_covfactor_update_term + calibration_term_A
@@ -257,6 +257,13 @@ class Kronecker(_linear_operator.LinearOperator):
         else:
             raise NotImplementedError
 
+    def diagonal(self):
+        # diag(A (x) B) = diag(A) (x) diag(B)
+        if self.A.shape[0] == self.A.shape[1] and self.B.shape[0] == self.B.shape[1]:
+            return np.kron(self.A.diagonal(), self.B.diagonal())
+        else:
+            raise NotImplementedError
+
 
 class SymmetricKronecker(_linear_operator.LinearOperator):
     """
@@ -348,6 +355,12 @@ class SymmetricKronecker(_linear_operator.LinearOperator):
         B_dense = self.B.todense()
         return 0.5 * (np.kron(A_dense, B_dense) + np.kron(B_dense, A_dense))
 
+    def diagonal(self):
+        # diag(A (x)_s B) = 1/2 (diag(A) (x) diag(B) + diag(B) (x) diag(A))
+        A_diag = self.A.diagonal()
+        B_diag = self.B.diagonal()
+        return 0.5 * (np.kron(A_diag, B_diag) + np.kron(B_diag, A_diag))
+
     def inv(self):
         # (A (x)_s A)^-1 = A^-1 (x)_s A^-1
         if self._ABequal:
@@ -302,6 +302,28 @@ class LinearOperator(scipy.sparse.linalg.LinearOperator):
                 )
             return trace
 
+    def diagonal(self):
+        """
+        Diagonal of the linear operator.
+
+        Subclasses with structure should override this method, since the default
+        implementation computes the dense representation of the linear operator.
+
+        Returns
+        -------
+        diagonal : np.ndarray
+            Diagonal entries :math:`A_{ii}` of the linear operator.
+
+        Raises
+        ------
+        ValueError : If :meth:`diagonal` is called on a non-square matrix.
+        """
+        if self.shape[0] != self.shape[1]:
+            raise ValueError(
+                "The diagonal is only defined for square linear operators."
+            )
+        return np.diagonal(np.asarray(self.todense())).copy()
+
 
 class _CustomLinearOperator(
     scipy.sparse.linalg.interface._CustomLinearOperator, LinearOperator
@@ -338,6 +360,9 @@ class _TransposedLinearOperator(
     def inv(self):
         return self.A.inv().T
 
+    def diagonal(self):
+        return self.A.diagonal()
+
 
 class _SumLinearOperator(
     scipy.sparse.linalg.interface._SumLinearOperator, LinearOperator
@@ -358,6 +383,9 @@ class _SumLinearOperator(
     def trace(self):
         return self.A.trace() + self.B.trace()
 
+    def diagonal(self):
+        return self.A.diagonal() + self.B.diagonal()
+
 
 class _ProductLinearOperator(
     scipy.sparse.linalg.interface._ProductLinearOperator, LinearOperator
@@ -393,6 +421,10 @@ class _ScaledLinearOperator(
         A, alpha = self.args
         return alpha * A.trace()
 
+    def diagonal(self):
+        A, alpha = self.args
+        return alpha * A.diagonal()
+
 
 class _PowerLinearOperator(
     scipy.sparse.linalg.interface._PowerLinearOperator, LinearOperator
@@ -468,6 +500,9 @@ class ScalarMult(LinearOperator):
     def trace(self):
         return self.scalar * self.shape[0]
 
+    def diagonal(self):
+        return np.full(self.shape[0], self.scalar)
+
 
 class Identity(ScalarMult):
     """
@@ -515,6 +550,9 @@ class Identity(ScalarMult):
     def trace(self):
         return self.shape[0]
 
+    def diagonal(self):
+        return np.ones(self.shape[0])
+
 
 class MatrixMult(scipy.sparse.linalg.interface.MatrixLinearOperator, LinearOperator):
     """
@@ -573,3 +611,10 @@ class MatrixMult(scipy.sparse.linalg.interface.MatrixLinearOperator, LinearOpera
             raise ValueError("The trace is only defined for square linear operators.")
         else:
             return np.trace(self.A)
+
+    def diagonal(self):
+        if self.shape[0] != self.shape[1]:
+            raise ValueError(
+                "The diagonal is only defined for square linear operators."
+            )
+        return np.asarray(self.A.diagonal()).ravel()
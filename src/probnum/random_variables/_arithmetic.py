@@ -2,9 +2,10 @@
 variables. """
 
 import operator
-from typing import Any, Callable, Dict, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
+import scipy.sparse
 
 import probnum.linops as _linear_operators
 from probnum import utils as _utils
@@ -204,9 +205,8 @@ _sub_fns[(_Normal, _Normal)] = _Normal._sub_normal
 
 
 def _add_normal_dirac(norm_rv: _Normal, dirac_rv: _Dirac) -> _Normal:
-    return _Normal(
+    return norm_rv._clone_with_mean(
         mean=norm_rv.mean + dirac_rv.support,
-        cov=norm_rv.cov,
         random_state=_utils.derive_random_seed(
             norm_rv.random_state, dirac_rv.random_state
         ),
@@ -218,9 +218,8 @@ _add_fns[(_Dirac, _Normal)] = _swap_operands(_add_normal_dirac)
 
 
 def _sub_normal_dirac(norm_rv: _Normal, dirac_rv: _Dirac) -> _Normal:
-    return _Normal(
+    return norm_rv._clone_with_mean(
         mean=norm_rv.mean - dirac_rv.support,
-        cov=norm_rv.cov,
         random_state=_utils.derive_random_seed(
             norm_rv.random_state, dirac_rv.random_state
         ),
@@ -231,9 +230,8 @@ _sub_fns[(_Normal, _Dirac)] = _sub_normal_dirac
 
 
 def _sub_dirac_normal(dirac_rv: _Dirac, norm_rv: _Normal) -> _Normal:
-    return _Normal(
+    return norm_rv._clone_with_mean(
         mean=dirac_rv.support - norm_rv.mean,
-        cov=norm_rv.cov,
         random_state=_utils.derive_random_seed(
             dirac_rv.random_state, norm_rv.random_state
         ),
@@ -247,21 +245,12 @@ def _mul_normal_dirac(
     norm_rv: _Normal, dirac_rv: _Dirac
 ) -> Union[_Normal, _Dirac, type(NotImplemented)]:
     if dirac_rv.size == 1:
-        if dirac_rv.support == 0:
-            return _Dirac(
-                support=np.zeros_like(norm_rv.mean),
-                random_state=_utils.derive_random_seed(
-                    norm_rv.random_state, dirac_rv.random_state
-                ),
-            )
-        else:
-            return _Normal(
-                mean=dirac_rv.support * norm_rv.mean,
-                cov=(dirac_rv.support ** 2) * norm_rv.cov,
-                random_state=_utils.derive_random_seed(
-                    norm_rv.random_state, dirac_rv.random_state
-                ),
-            )
+        return norm_rv._mul_scalar(
+            dirac_rv.support,
+            random_state=_utils.derive_random_seed(
+                norm_rv.random_state, dirac_rv.random_state
+            ),
+        )
 
     return NotImplemented
 
@@ -270,23 +259,99 @@ _mul_fns[(_Normal, _Dirac)] = _mul_normal_dirac
 _mul_fns[(_Dirac, _Normal)] = _swap_operands(_mul_normal_dirac)
 
 
+def _diagonal_or_none(A: Any) -> Optional[np.ndarray]:
+    """Return the diagonal of ``A`` if it is a dense, square, diagonal matrix."""
+    if isinstance(A, np.ndarray) and A.ndim == 2 and A.shape[0] == A.shape[1]:
+        diag = np.diagonal(A)
+
+        if np.count_nonzero(A) == np.count_nonzero(diag):
+            return diag
+
+    return None
+
+
+def _transform_cov(A: Any, cov: Any) -> Any:
+    """Compute ``A @ cov @ A.T``, exploiting the structure of ``A`` if possible.
+
+    For a dense covariance matrix, vectors, sparse and diagonal matrices ``A`` avoid
+    the two dense matrix-matrix products of the general case.
+    """
+    if isinstance(cov, np.ndarray):
+        if scipy.sparse.issparse(A):
+            cov_AT = np.asarray(A @ cov).T
+
+            return np.asarray(A @ cov_AT)
+
+        if isinstance(A, np.ndarray) and A.ndim == 1:
+            return A @ (cov @ A)
+
+        diag = _diagonal_or_none(A)
+
+        if diag is not None:
+            return diag[:, None] * cov * diag[None, :]
+
+    return A @ (cov @ A.T)
+
+
+def _transform_cov_cholesky(A: Any, cov_cholesky: Optional[np.ndarray]) -> Any:
+    """Compute a Cholesky factor of ``A @ cov @ A.T`` from a Cholesky factor of
+    ``cov`` if ``A`` is a diagonal matrix.
+
+    In this case, the factor is a rescaling of the rows of the given factor, which is
+    much cheaper than refactorizing the transformed covariance matrix. Returns
+    ``None`` otherwise.
+    """
+    if cov_cholesky is None:
+        return None
+
+    diag = _diagonal_or_none(A)
+
+    if diag is None:
+        return None
+
+    # Flip signs of columns such that the factor has a non-negative diagonal, as a
+    # Cholesky factor should
+    return diag[:, None] * cov_cholesky * np.where(diag < 0, -1.0, 1.0)[None, :]
+
+
+def _transform_matrixvariate_cov(cov: Any, A: np.ndarray) -> Any:
+    """Compute the covariance of :math:`XA` from the covariance of a matrix-variate
+    random variable :math:`X`.
+
+    With the row-major vectorization used throughout, :math:`\\operatorname{vec}(XA)
+    = (I \\otimes A^\\top) \\operatorname{vec}(X)`. For a dense covariance matrix,
+    the transformation is applied as two tensor contractions with ``A`` instead of
+    two matrix products with the (much larger) Kronecker product.
+    """
+    m, n = cov.shape[0] // A.shape[0], A.shape[0]
+
+    if isinstance(cov, np.ndarray):
+        # Contract the column indices of both copies of `X` with `A`
+        cov_A = cov.reshape(m, n, m, n) @ A
+        A_cov_A = np.tensordot(cov_A, A, axes=([1], [0]))
+
+        return A_cov_A.transpose(0, 3, 1, 2).reshape(m * A.shape[1], m * A.shape[1])
+
+    cov_update = _linear_operators.Kronecker(
+        _linear_operators.Identity(m), _linear_operators.aslinop(A.T)
+    )
+
+    return cov_update @ cov @ cov_update.T
+
+
 def _matmul_normal_dirac(norm_rv: _Normal, dirac_rv: _Dirac) -> _Normal:
     if norm_rv.ndim == 1 or (norm_rv.ndim == 2 and norm_rv.shape[0] == 1):
         return _Normal(
             mean=norm_rv.mean @ dirac_rv.support,
-            cov=dirac_rv.support.T @ (norm_rv.cov @ dirac_rv.support),
+            cov=_transform_cov(dirac_rv.support.T, norm_rv.cov),
             random_state=_utils.derive_random_seed(
                 norm_rv.random_state, dirac_rv.random_state
             ),
         )
     elif norm_rv.ndim == 2 and norm_rv.shape[0] > 1:
-        cov_update = _linear_operators.Kronecker(
-            _linear_operators.Identity(dirac_rv.shape[0]), dirac_rv.support
-        )
-
         return _Normal(
             mean=norm_rv.mean @ dirac_rv.support,
-            cov=cov_update.T @ (norm_rv.cov @ cov_update),
+            cov=_transform_matrixvariate_cov(norm_rv.cov, dirac_rv.support),
             random_state=_utils.derive_random_seed(
                 norm_rv.random_state, dirac_rv.random_state
             ),
@@ -303,9 +368,14 @@ _matmul_fns[(_Normal, _Dirac)] = _matmul_normal_dirac
 
 def _matmul_dirac_normal(dirac_rv: _Dirac, norm_rv: _Normal) -> _Normal:
     if norm_rv.ndim == 1 or (norm_rv.ndim == 2 and norm_rv.shape[1] == 1):
+        cov_cholesky = _transform_cov_cholesky(
+            dirac_rv.support, norm_rv._known_dense_cov_cholesky
+        )
+
         return _Normal(
             mean=dirac_rv.support @ norm_rv.mean,
-            cov=dirac_rv.support @ (norm_rv.cov @ dirac_rv.support.T),
+            cov=_transform_cov(dirac_rv.support, norm_rv.cov),
+            cov_cholesky=cov_cholesky,
             random_state=_utils.derive_random_seed(
                 dirac_rv.random_state, norm_rv.random_state
             ),
@@ -322,12 +392,8 @@ _matmul_fns[(_Dirac, _Normal)] = _matmul_dirac_normal
 
 def _truediv_normal_dirac(norm_rv: _Normal, dirac_rv: _Dirac) -> _Normal:
     if dirac_rv.size == 1:
-        if dirac_rv.support == 0:
-            raise ZeroDivisionError
-
-        return _Normal(
-            mean=norm_rv.mean / dirac_rv.support,
-            cov=norm_rv.cov / (dirac_rv.support ** 2),
+        return norm_rv._truediv_scalar(
+            dirac_rv.support,
             random_state=_utils.derive_random_seed(
                 norm_rv.random_state, dirac_rv.random_state
             ),
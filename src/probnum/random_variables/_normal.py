@@ -1,6 +1,7 @@
 """ This module implements normally distributed or Gaussian random variables. """
 
-from typing import Callable, Optional, Union
+import numbers
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 import scipy.linalg
@@ -16,7 +17,7 @@ from probnum.type import (
     ShapeType,
 )
 
-from . import _random_variable
+from . import _dirac, _random_variable
 
 try:
     # functools.cached_property is only available in Python >=3.8
@@ -30,6 +31,11 @@ COV_CHOLESKY_DAMPING = 10 ** -12
 
 _ValueType = Union[np.floating, np.ndarray, linops.LinearOperator]
 
+# Python scalar types which are converted to NumPy scalars on construction. Checking
+# against this tuple is considerably cheaper than `np.isscalar`, which matters since
+# normal random variables are created in the inner loops of filters and solvers.
+_SCALAR_TYPES = (numbers.Number,)
+
 
 class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
     """
@@ -82,19 +88,15 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         random_state: RandomStateArgType = None,
     ):
         # Type normalization
-        if np.isscalar(mean):
+        if isinstance(mean, _SCALAR_TYPES):
             mean = _utils.as_numpy_scalar(mean)
 
-        if np.isscalar(cov):
+        if isinstance(cov, _SCALAR_TYPES):
             cov = _utils.as_numpy_scalar(cov)
 
         # Data type normalization
-        is_mean_floating = mean.dtype is not None and np.issubdtype(
-            mean.dtype, np.floating
-        )
-        is_cov_floating = cov.dtype is not None and np.issubdtype(
-            cov.dtype, np.floating
-        )
+        is_mean_floating = mean.dtype is not None and mean.dtype.kind == "f"
+        is_cov_floating = cov.dtype is not None and cov.dtype.kind == "f"
 
         if is_mean_floating and is_cov_floating:
             dtype = np.promote_types(mean.dtype, cov.dtype)
@@ -129,32 +131,51 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
                 )
 
         # Shape checking
-        if len(mean.shape) not in [0, 1, 2]:
+        mean_shape = mean.shape
+        mean_ndim = len(mean_shape)
+
+        if mean_ndim == 0:
+            expected_cov_shape = ()
+        elif mean_ndim == 1:
+            expected_cov_shape = (mean_shape[0],) * 2
+        elif mean_ndim == 2:
+            expected_cov_shape = (mean_shape[0] * mean_shape[1],) * 2
+        else:
             raise ValueError(
                 f"Gaussian random variables must either be scalars, vectors, or "
-                f"matrices (or linear operators), but the given mean is a {mean.ndim}-"
+                f"matrices (or linear operators), but the given mean is a {mean_ndim}-"
                 f"dimensional tensor."
             )
 
-        expected_cov_shape = (np.prod(mean.shape),) * 2 if len(mean.shape) > 0 else ()
-
-        if len(cov.shape) != len(expected_cov_shape) or cov.shape != expected_cov_shape:
+        if cov.shape != expected_cov_shape:
             raise ValueError(
                 f"The covariance matrix must be of shape {expected_cov_shape}, but "
                 f"shape {cov.shape} was given."
             )
 
+        self._init_from_validated(mean, cov, cov_cholesky, random_state)
+
+    def _init_from_validated(
+        self,
+        mean: Union[np.floating, np.ndarray, linops.LinearOperator],
+        cov: Union[np.floating, np.ndarray, linops.LinearOperator],
+        cov_cholesky: Optional[Union[np.ndarray, linops.LinearOperator]],
+        random_state: RandomStateArgType,
+    ) -> None:
+        """Select the methods implementing the distribution given a mean and
+        covariance, which have already been normalized and checked for consistent
+        shapes and dtypes."""
         self._mean = mean
         self._cov = cov
 
         self._compute_cov_cholesky: Callable[[], _ValueType] = None
+        self._given_dense_cov_cholesky: Optional[np.ndarray] = None
 
         # Method selection
-        univariate = len(mean.shape) == 0
-        dense = isinstance(mean, np.ndarray) and isinstance(cov, np.ndarray)
         cov_operator = isinstance(cov, linops.LinearOperator)
+        dense = not cov_operator and isinstance(mean, np.ndarray)
 
-        if univariate:
+        if len(mean.shape) == 0:
             # Univariate Gaussian
             sample = self._univariate_sample
             in_support = Normal._univariate_in_support
@@ -207,6 +228,9 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
 
                 self._compute_cov_cholesky = lambda: cov_cholesky
 
+                if dense:
+                    self._given_dense_cov_cholesky = cov_cholesky
+
             if isinstance(cov, linops.SymmetricKronecker):
                 m, n = mean.shape
 
@@ -238,6 +262,8 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
                         "shape as the mean."
                     )
 
+                sample = self._kronecker_sample
+
                 self._compute_cov_cholesky = self._kronecker_cov_cholesky
         else:
             raise ValueError(
@@ -273,6 +299,21 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
 
         return self._compute_cov_cholesky()
 
+    @property
+    def _known_dense_cov_cholesky(self) -> Optional[np.ndarray]:
+        """Cholesky factor of a dense covariance matrix if it was passed on
+        construction or has already been computed, ``None`` otherwise.
+
+        This allows arithmetic operations to propagate the factor instead of
+        refactorizing the transformed covariance matrix."""
+        if self._given_dense_cov_cholesky is not None:
+            return self._given_dense_cov_cholesky
+
+        if isinstance(self._cov, np.ndarray) and self.ndim > 0:
+            return self.__dict__.get("cov_cholesky")
+
+        return None
+
     @cached_property
     def dense_mean(self) -> Union[np.floating, np.ndarray]:
         if isinstance(self._mean, linops.LinearOperator):
@@ -370,19 +411,136 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
     # Unary arithmetic operations
 
     def __neg__(self) -> "Normal":
-        return Normal(
+        return self._clone_with_mean(
             mean=-self._mean,
-            cov=self._cov,
             random_state=_utils.derive_random_seed(self.random_state),
         )
 
     def __pos__(self) -> "Normal":
-        return Normal(
+        return self._clone_with_mean(
             mean=+self._mean,
-            cov=self._cov,
             random_state=_utils.derive_random_seed(self.random_state),
         )
 
+    # Binary arithmetic operations with scalars are handled directly, instead of
+    # wrapping the scalar into a `Dirac` random variable first. The scalar is still
+    # converted to a NumPy scalar, so that e.g. overflows follow NumPy semantics.
+
+    def __mul__(self, other: Any) -> _random_variable.RandomVariable:
+        if isinstance(other, _SCALAR_TYPES):
+            return self._mul_scalar(
+                _utils.as_numpy_scalar(other),
+                random_state=_utils.derive_random_seed(self.random_state),
+            )
+
+        return super().__mul__(other)
+
+    def __rmul__(self, other: Any) -> _random_variable.RandomVariable:
+        if isinstance(other, _SCALAR_TYPES):
+            return self._mul_scalar(
+                _utils.as_numpy_scalar(other),
+                random_state=_utils.derive_random_seed(self.random_state),
+            )
+
+        return super().__rmul__(other)
+
+    def __truediv__(self, other: Any) -> _random_variable.RandomVariable:
+        if isinstance(other, _SCALAR_TYPES):
+            return self._truediv_scalar(
+                _utils.as_numpy_scalar(other),
+                random_state=_utils.derive_random_seed(self.random_state),
+            )
+
+        return super().__truediv__(other)
+
+    def _mul_scalar(
+        self, alpha: Union[np.number, np.ndarray], random_state: RandomStateArgType
+    ) -> _random_variable.RandomVariable:
+        if alpha == 0:
+            return _dirac.Dirac(
+                support=np.zeros_like(self.mean), random_state=random_state
+            )
+
+        cov_cholesky = self._known_dense_cov_cholesky
+
+        if cov_cholesky is not None:
+            cov_cholesky = np.abs(alpha) * cov_cholesky
+
+        return Normal(
+            mean=alpha * self.mean,
+            cov=(alpha ** 2) * self.cov,
+            cov_cholesky=cov_cholesky,
+            random_state=random_state,
+        )
+
+    def _truediv_scalar(
+        self, alpha: Union[np.number, np.ndarray], random_state: RandomStateArgType
+    ) -> "Normal":
+        if alpha == 0:
+            raise ZeroDivisionError
+
+        cov_cholesky = self._known_dense_cov_cholesky
+
+        if cov_cholesky is not None:
+            cov_cholesky = cov_cholesky / np.abs(alpha)
+
+        return Normal(
+            mean=self.mean / alpha,
+            cov=self.cov / (alpha ** 2),
+            cov_cholesky=cov_cholesky,
+            random_state=random_state,
+        )
+
+    # Quantities which only depend on the covariance and can therefore be shared
+    # between normal random variables which only differ in their means
+    _COV_CACHED_PROPERTIES = (
+        "cov",
+        "var",
+        "std",
+        "entropy",
+        "dense_cov",
+        "cov_cholesky",
+    )
+
+    def _clone_with_mean(
+        self,
+        mean: Union[np.floating, np.ndarray, linops.LinearOperator],
+        random_state: RandomStateArgType = None,
+    ) -> "Normal":
+        """Create a normal random variable with the covariance of this one and a new
+        mean.
+
+        If the new mean has the same type, shape and dtype as the current one, type
+        normalization and shape checking are skipped and all cached quantities which
+        only depend on the covariance, e.g. its Cholesky factor, are reused.
+        """
+        if not (
+            type(mean) is type(self._mean)  # pylint: disable=unidiomatic-typecheck
+            and mean.shape == self.shape
+            and mean.dtype == self.dtype
+            and (not isinstance(mean, np.ndarray) or mean.flags.c_contiguous)
+        ):
+            return Normal(
+                mean=mean,
+                cov=self._cov,
+                cov_cholesky=self._given_dense_cov_cholesky,
+                random_state=random_state,
+            )
+
+        clone = Normal.__new__(Normal)
+        clone._init_from_validated(
+            mean=mean,
+            cov=self._cov,
+            cov_cholesky=self._given_dense_cov_cholesky,
+            random_state=random_state,
+        )
+
+        for name in Normal._COV_CACHED_PROPERTIES:
+            if name in self.__dict__:
+                clone.__dict__[name] = self.__dict__[name]
+
+        return clone
+
     # TODO: Overwrite __abs__ and add absolute moments of normal
     # TODO: (https://arxiv.org/pdf/1209.4340.pdf)
 
@@ -472,15 +630,50 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
             lower=True,
         )
 
-    def _dense_sample(self, size: ShapeType = ()) -> np.ndarray:
-        sample = scipy.stats.multivariate_normal.rvs(
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
-            size=size,
-            random_state=self.random_state,
+    def _undamped_dense_cov_cholesky(self) -> Optional[np.ndarray]:
+        """Lower Cholesky factor of the exact, i.e. undamped, dense covariance, or
+        ``None`` if the covariance is not (numerically) positive definite.
+
+        Unlike :attr:`cov_cholesky`, this factor does not bias samples and densities
+        of covariances on the scale of :data:`COV_CHOLESKY_DAMPING`."""
+        if self._given_dense_cov_cholesky is not None:
+            return self._given_dense_cov_cholesky
+
+        try:
+            return scipy.linalg.cholesky(self.dense_cov, lower=True)
+        except np.linalg.LinAlgError:
+            return None
+
+    @cached_property
+    def _dense_scipy_frozen(self):
+        """Frozen :class:`scipy.stats.multivariate_normal` distribution, which
+        decomposes the covariance only once for all subsequent calls."""
+        return scipy.stats.multivariate_normal(
+            mean=self.dense_mean.ravel(), cov=self.dense_cov, allow_singular=True
         )
 
-        return sample.reshape(sample.shape[:-1] + self.shape)
+    def _dense_sample(self, size: ShapeType = ()) -> np.ndarray:
+        cov_cholesky = self._undamped_dense_cov_cholesky()
+
+        if cov_cholesky is None:
+            # Semi-definite covariances are decomposed by scipy in each call
+            sample = scipy.stats.multivariate_normal.rvs(
+                mean=self.dense_mean.ravel(),
+                cov=self.dense_cov,
+                size=size,
+                random_state=self.random_state,
+            )
+        else:
+            stdnormal_samples = scipy.stats.norm.rvs(
+                size=size + (self.size,), random_state=self.random_state
+            )
+
+            sample = stdnormal_samples @ cov_cholesky.T
+            sample += self.dense_mean.ravel()
+
+        # Singleton sample dimensions are squeezed, as by
+        # `scipy.stats.multivariate_normal.rvs`
+        return sample.reshape(tuple(dim for dim in size if dim != 1) + self.shape)
 
     @staticmethod
     def _arg_todense(x: Union[np.ndarray, linops.LinearOperator]) -> np.ndarray:
@@ -496,64 +689,122 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         return np.all(np.isfinite(Normal._arg_todense(x)))
 
     def _dense_pdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.multivariate_normal.pdf(
-            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,)),
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
-        )
+        return np.exp(self._dense_logpdf(x))
 
     def _dense_logpdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.multivariate_normal.logpdf(
-            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,)),
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
+        cov_cholesky = self._undamped_dense_cov_cholesky()
+
+        # Densities of degenerate distributions are evaluated by scipy
+        if cov_cholesky is None or not np.all(np.diag(cov_cholesky) > 0):
+            return self._dense_scipy_frozen.logpdf(
+                Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,))
+            )
+
+        x_dense = Normal._arg_todense(x)
+        batch_shape = x_dense.shape[: x_dense.ndim - self.ndim]
+        x_centered = x_dense.reshape(-1, self.size) - self.dense_mean.ravel()
+
+        # Mahalanobis distance via a triangular solve with the Cholesky factor
+        x_whitened = scipy.linalg.solve_triangular(
+            cov_cholesky, x_centered.T, lower=True
         )
+        maha = np.sum(x_whitened ** 2, axis=0).reshape(batch_shape)
+        logdet = 2.0 * np.sum(np.log(np.diag(cov_cholesky)))
+
+        logpdf = -0.5 * (self.size * np.log(2.0 * np.pi) + logdet + maha)
+
+        # Squeeze the output like `scipy.stats.multivariate_normal.logpdf`
+        logpdf = np.squeeze(logpdf)
+        if logpdf.ndim == 0:
+            logpdf = logpdf[()]
+
+        return logpdf
 
     def _dense_cdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.multivariate_normal.cdf(
-            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,)),
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
+        return self._dense_scipy_frozen.cdf(
+            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,))
         )
 
     def _dense_logcdf(self, x: _ValueType) -> np.float_:
-        return scipy.stats.multivariate_normal.logcdf(
-            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,)),
-            mean=self.dense_mean.ravel(),
-            cov=self.dense_cov,
+        return self._dense_scipy_frozen.logcdf(
+            Normal._arg_todense(x).reshape(x.shape[: -self.ndim] + (-1,))
         )
 
     def _dense_var(self) -> np.ndarray:
-        return np.diag(self.dense_cov).reshape(self.shape)
+        # Avoid materializing structured covariance operators
+        return self._cov.diagonal().reshape(self.shape)
 
     def _dense_entropy(self) -> np.float_:
         return _utils.as_numpy_scalar(
-            scipy.stats.multivariate_normal.entropy(
-                mean=self.dense_mean.ravel(),
-                cov=self.dense_cov,
-            ),
-            dtype=np.float_,
+            self._dense_scipy_frozen.entropy(), dtype=np.float_
         )
 
     # Matrixvariate Gaussian with Kronecker covariance
     def _kronecker_cov_cholesky(self) -> linops.Kronecker:
         assert isinstance(self._cov, linops.Kronecker)
 
-        A = self._cov.A.todense()
-        B = self._cov.B.todense()
-
         return linops.Kronecker(
-            A=scipy.linalg.cholesky(
-                A + COV_CHOLESKY_DAMPING * np.eye(A.shape[0], dtype=self.dtype),
-                lower=True,
-            ),
-            B=scipy.linalg.cholesky(
-                B + COV_CHOLESKY_DAMPING * np.eye(B.shape[0], dtype=self.dtype),
-                lower=True,
-            ),
+            A=self._kronecker_factor_cholesky(self._cov.A),
+            B=self._kronecker_factor_cholesky(self._cov.B),
             dtype=self.dtype,
         )
 
+    def _kronecker_factor_cholesky(
+        self,
+        factor: linops.LinearOperator,
+        damping: FloatArgType = COV_CHOLESKY_DAMPING,
+    ) -> Union[np.ndarray, linops.ScalarMult]:
+        """Lower Cholesky factor of a Kronecker factor of the covariance, damped by
+        ``damping``.
+
+        Scalar multiples of the identity are factorized analytically, which avoids
+        forming and factorizing a dense matrix."""
+        if isinstance(factor, linops.ScalarMult):
+            if factor.scalar + damping <= 0:
+                raise np.linalg.LinAlgError(
+                    "The Kronecker factor is not positive definite."
+                )
+
+            return linops.ScalarMult(
+                shape=factor.shape, scalar=np.sqrt(factor.scalar + damping)
+            )
+
+        return scipy.linalg.cholesky(
+            factor.todense() + damping * np.eye(factor.shape[0], dtype=self.dtype),
+            lower=True,
+        )
+
+    def _kronecker_sample(self, size: ShapeType = ()) -> np.ndarray:
+        assert isinstance(self._cov, linops.Kronecker)
+
+        # Samples are drawn with the Cholesky factors of the exact Kronecker factors,
+        # since the damping in `cov_cholesky` would bias small covariances
+        try:
+            cholA = self._kronecker_factor_cholesky(self._cov.A, damping=0.0)
+            cholB = self._kronecker_factor_cholesky(self._cov.B, damping=0.0)
+        except np.linalg.LinAlgError:
+            return self._dense_sample(size=size)
+
+        sample = scipy.stats.norm.rvs(
+            size=size + self.shape, random_state=self.random_state
+        )
+
+        # (L_A (x) L_B)vec(Z) = vec(L_A Z L_B^T), so the (m x m) and (n x n) Cholesky
+        # factors are applied without forming the (mn x mn) covariance
+        if isinstance(cholA, linops.ScalarMult):
+            sample *= cholA.scalar
+        else:
+            sample = cholA @ sample
+
+        if isinstance(cholB, linops.ScalarMult):
+            sample *= cholB.scalar
+        else:
+            sample = sample @ cholB.T
+        sample += self.dense_mean
+
+        # Singleton sample dimensions are squeezed, as in `_dense_sample`
+        return sample.reshape(tuple(dim for dim in size if dim != 1) + self.shape)
+
     # Matrixvariate Gaussian with symmetric Kronecker covariance from identical
     # factors
     def _symmetric_kronecker_identical_factors_cov_cholesky(
@@ -561,14 +812,8 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
     ) -> linops.SymmetricKronecker:
         assert isinstance(self._cov, linops.SymmetricKronecker) and self._cov._ABequal
 
-        A = self._cov.A.todense()
-
         return linops.SymmetricKronecker(
-            A=scipy.linalg.cholesky(
-                A + COV_CHOLESKY_DAMPING * np.eye(A.shape[0], dtype=self.dtype),
-                lower=True,
-            ),
-            dtype=self.dtype,
+            A=self._kronecker_factor_cholesky(self._cov.A), dtype=self.dtype
         )
 
     def _symmetric_kronecker_identical_factors_sample(
@@ -577,6 +822,7 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         assert isinstance(self._cov, linops.SymmetricKronecker) and self._cov._ABequal
 
         n = self._mean.shape[1]
+        cholA = self.cov_cholesky.A
 
         # Draw standard normal samples
         size_sample = (n * n,) + size
@@ -584,11 +830,21 @@ class Normal(_random_variable.ContinuousRandomVariable[_ValueType]):
         stdnormal_samples = scipy.stats.norm.rvs(
             size=size_sample, random_state=self.random_state
         )
+        stdnormal_samples = np.moveaxis(stdnormal_samples, 0, -1).reshape(size + (n, n))
 
         # Appendix E: Bartels, S., Probabilistic Linear Algebra, PhD Thesis 2019
-        samples_scaled = linops.Symmetrize(dim=n) @ (
-            self.cov_cholesky @ stdnormal_samples
-        )
+        # Symmetrize((L (x)_s L)vec(Z)) = 1/2 (L Z L^T + (L Z L^T)^T), which is
+        # evaluated for all samples at once by batched matrix multiplication
+        if isinstance(cholA, linops.ScalarMult):
+            samples_scaled = cholA.scalar ** 2 * stdnormal_samples
+        else:
+            cholA = cholA.todense()
+            samples_scaled = cholA @ stdnormal_samples @ cholA.T
+
+        sample = samples_scaled + np.swapaxes(samples_scaled, -1, -2)
+        sample *= 0.5
 
         # TODO: can we avoid todense here and just return operator samples?
-        return self.dense_mean[None, :, :] + samples_scaled.T.reshape(-1, n, n)
+        sample += self.dense_mean
+
+        return sample
@@ -5,6 +5,8 @@ This module implements random variables. Random variables are the main in- and o
 of probabilistic numerical methods.
 """
 
+import functools
+import operator
 from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar, Union
 
 import numpy as np
@@ -153,7 +155,9 @@ class RandomVariable(Generic[_ValueType]):
 
     @cached_property
     def size(self) -> int:
-        return int(np.prod(self.__shape))
+        # Avoid the array conversion in `np.prod`, since this is evaluated for every
+        # random variable whose moments are accessed
+        return functools.reduce(operator.mul, self.__shape, 1)
 
     @property
     def dtype(self) -> np.dtype:
@@ -829,7 +833,7 @@ class RandomVariable(Generic[_ValueType]):
                 )
 
         if dtype is not None:
-            if not np.issubdtype(value.dtype, dtype):
+            if value.dtype != dtype and not np.issubdtype(value.dtype, dtype):
                 raise ValueError(
                     f"The {name} of the random variable does not have the correct "
                     f"dtype. Expected {dtype.name} but got {value.dtype.name}."
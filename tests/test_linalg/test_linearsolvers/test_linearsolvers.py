@@ -1,8 +1,10 @@
 """Tests for linear solvers."""
+import functools
 import os
 import unittest
 
 import numpy as np
+import scipy.linalg
 import scipy.sparse
 import scipy.sparse.linalg
 
@@ -11,34 +13,84 @@ from probnum import linalg, linops
 from probnum import random_variables as rvs
 from tests.testing import NumpyAssertions
 
+# Absolute tolerances for solving a linear system with zero right hand side
+_ZERO_RHS_TOLS = np.logspace(-10, 2, 7)
 
-class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
+
+@functools.lru_cache(maxsize=1)
+def _load_poisson_linear_system():
+    """Load the Poisson linear system from disk once per test session.
+
+    Poisson equation with Dirichlet conditions.
+
+      - Laplace(u) = f    in the interior
+                 u = u_D  on the boundary
+    where
+        u_D = 1 + x^2 + 2y^2
+        f = -4
+
+    Linear system resulting from discretization on an elliptic grid. The returned
+    arrays are shared between tests and must not be modified in place.
+    """
+    fpath = os.path.join(os.path.dirname(__file__), "../../resources")
+    A = scipy.sparse.load_npz(file=fpath + "/matrix_poisson.npz")
+    f = np.load(file=fpath + "/rhs_poisson.npy")
+    f.setflags(write=False)
+    return A, f
+
+
+def _random_diagonally_dominant_spd_matrix(rng, n):
+    """Random symmetric, diagonally dominant and hence positive definite matrix."""
+    A = rng.random((n, n))
+    A += A.T
+    A *= 0.5
+    A[np.diag_indices(n)] += n
+    return A
+
+
+class _PoissonLinearSystemMixin:
+    """Provides the Poisson linear system to all tests of a test case."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.poisson_linear_system = _load_poisson_linear_system()
+
+
+class LinearSolverTestCase(
+    _PoissonLinearSystemMixin, unittest.TestCase, NumpyAssertions
+):
     """General test case for linear solvers."""
 
-    def setUp(self):
-        """Resources for tests."""
+    @classmethod
+    def setUpClass(cls):
+        """Linear systems, reference solutions and solvers shared by all tests."""
+        super().setUpClass()
+        A, f = cls.poisson_linear_system
+        # Sparse LU factorization reused for all reference solves A^{-1} b
+        cls.poisson_lu = scipy.sparse.linalg.splu(A.tocsc())
+        cls.poisson_solution = cls.poisson_lu.solve(f)
+
+        # Conjugate gradient iterates with initial guess as chosen by PLS:
+        # x0 = Ainv.mean @ b
+        cg_iterates = [f]
+
+        def callback_iterates_CG(xk):
+            cg_iterates.append(xk.copy())
 
-        # Poisson equation with Dirichlet conditions.
-        #
-        #   - Laplace(u) = f    in the interior
-        #              u = u_D  on the boundary
-        # where
-        #     u_D = 1 + x^2 + 2y^2
-        #     f = -4
-        #
-        # Linear system resulting from discretization on an elliptic grid.
-        fpath = os.path.join(os.path.dirname(__file__), "../../resources")
-        A = scipy.sparse.load_npz(file=fpath + "/matrix_poisson.npz")
-        f = np.load(file=fpath + "/rhs_poisson.npy")
-        self.poisson_linear_system = A, f
+        xhat_cg, _ = scipy.sparse.linalg.cg(
+            A=A, b=f, x0=f, tol=10 ** -6, callback=callback_iterates_CG
+        )
+        cls.poisson_cg_solution = xhat_cg
+        cls.poisson_cg_iterates = np.array(cg_iterates)
 
         # Kernel matrices
-        np.random.seed(42)
+        random_state = np.random.RandomState(42)
 
         # Toy data
         n = 100
         x_min, x_max = (-4.0, 4.0)
-        X = np.random.uniform(x_min, x_max, (n, 1))
+        X = random_state.uniform(x_min, x_max, (n, 1))
 
         # RBF kernel
         lengthscale = 1
@@ -50,18 +102,36 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
             * (X_norm[:, None] + X_norm[None, :] - 2 * np.dot(X, X.T))
         )
         K_rbf = K_rbf + 10 ** -2 * np.eye(n)
-        x_true = np.random.normal(size=(n,))
+        x_true = random_state.normal(size=(n,))
         b = K_rbf @ x_true
-        self.rbf_kernel_linear_system = K_rbf, b, x_true
+        for arr in (K_rbf, b, x_true):
+            arr.setflags(write=False)
+        cls.rbf_kernel_linear_system = K_rbf, b, x_true
 
         # Probabilistic linear solvers
-        self.problinsolvers = [linalg.problinsolve]  # , linalg.bayescg]
+        cls.problinsolvers = (linalg.problinsolve,)  # , linalg.bayescg)
 
         # Matrix-based linear solvers
-        self.matblinsolvers = [linalg.problinsolve]
+        cls.matblinsolvers = (linalg.problinsolve,)
 
         # Solution-based linear solvers
-        self.solblinsolvers = [linalg.bayescg]
+        cls.solblinsolvers = (linalg.bayescg,)
+
+    def setUp(self):
+        """Resources for tests."""
+        # Seed
+        np.random.seed(42)
+
+    def assertSymmetric(self, M, rtol=1e-7):
+        """Assert that a matrix or linear operator is symmetric.
+
+        Scalar multiples of the identity are symmetric by construction and are not
+        densified."""
+        if isinstance(M, linops.ScalarMult):
+            return
+        if isinstance(M, linops.LinearOperator):
+            M = M.todense()
+        self.assertAllClose(M, M.T, rtol=rtol)
 
     def test_dimension_mismatch(self):
         """Test whether linear solvers throw an exception for input with mismatched dimensions."""
@@ -100,13 +170,12 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
 
     def test_randvar_output(self):
         """Probabilistic linear solvers output random variables."""
-        np.random.seed(1)
+        rng = np.random.default_rng(1)
         n = 10
-        A = np.random.rand(n, n)
-        A = 0.5 * (A + A.T) + n * np.eye(n)
-        b = np.random.rand(n)
+        A = _random_diagonally_dominant_spd_matrix(rng, n)
+        b = rng.random(n)
         for plinsolve in self.problinsolvers:
-            with self.subTest():
+            with self.subTest(plinsolve=plinsolve.__name__):
                 x, A, Ainv, _ = plinsolve(A=A, b=b)
                 for rv in [x, A, Ainv]:
                     self.assertIsInstance(
@@ -117,66 +186,65 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
 
     def test_symmetric_posterior_params(self):
         """Test whether posterior parameters are symmetric."""
-        np.random.seed(1)
+        rng = np.random.default_rng(1)
         n = 10
-        A = np.random.rand(n, n)
-        A = 0.5 * (A + A.T) + n * np.eye(n)
-        b = np.random.rand(n)
+        A = _random_diagonally_dominant_spd_matrix(rng, n)
+        b = rng.random(n)
 
         for matblinsolve in self.matblinsolvers:
-            with self.subTest():
+            with self.subTest(matblinsolve=matblinsolve.__name__):
                 _, _, Ainv, _ = matblinsolve(A=A, b=b)
-                Ainv_mean = Ainv.mean.todense()
-                Ainv_cov_A = Ainv.cov.A.todense()
-                Ainv_cov_B = Ainv.cov.B.todense()
-                self.assertAllClose(Ainv_mean, Ainv_mean.T, rtol=1e-6)
-                self.assertAllClose(Ainv_cov_A, Ainv_cov_B, rtol=1e-6)
-                self.assertAllClose(Ainv_cov_A, Ainv_cov_A.T, rtol=1e-6)
+                self.assertSymmetric(Ainv.mean, rtol=1e-6)
+                self.assertSymmetric(Ainv.cov.A, rtol=1e-6)
+                # Identical Kronecker factors need not be compared
+                if Ainv.cov.B is not Ainv.cov.A:
+                    self.assertAllClose(
+                        Ainv.cov.A.todense(), Ainv.cov.B.todense(), rtol=1e-6
+                    )
 
     def test_zero_rhs(self):
         """Linear system with zero right hand side."""
-        np.random.seed(1234)
+        rng = np.random.default_rng(1234)
         n = 10
-        A = np.random.rand(n, n)
-        A = 0.5 * (A + A.T) + n * np.eye(n)
+        A = _random_diagonally_dominant_spd_matrix(rng, n)
         b = np.zeros(n)
-        tols = np.r_[np.logspace(np.log10(1e-10), np.log10(1e2), 7)]
 
         for plinsolve in self.problinsolvers:
-            with self.subTest():
-                for tol in tols:
+            for tol in _ZERO_RHS_TOLS:
+                with self.subTest(plinsolve=plinsolve.__name__, tol=tol):
                     x, _, _, info = plinsolve(A=A, b=b, atol=tol)
                     self.assertAllClose(x.mean, 0, atol=1e-15)
 
     def test_multiple_rhs(self):
         """Linear system with matrix right hand side."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n = 10
-        A = np.random.rand(n, n)
-        A = 0.5 * (A + A.T) + n * np.eye(n)
-        B = np.random.rand(10, 5)
+        A = _random_diagonally_dominant_spd_matrix(rng, n)
+        B = rng.random((10, 5))
+
+        # Reference solution via a Cholesky factorization of the spd system matrix
+        X = scipy.linalg.cho_solve(scipy.linalg.cho_factor(A), B)
 
         for plinsolve in self.problinsolvers:
-            with self.subTest():
+            with self.subTest(plinsolve=plinsolve.__name__):
                 x, _, _, info = plinsolve(A=A, b=B)
                 self.assertEqual(
                     x.shape,
                     B.shape,
                     msg="Shape of solution and right hand side do not match.",
                 )
-                self.assertAllClose(x.mean, np.linalg.solve(A, B))
+                self.assertAllClose(x.mean, X)
 
     def test_spd_matrix(self):
         """Random spd matrix."""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         n = 40
-        A = np.random.rand(n, n)
-        A = 0.5 * (A + A.T) + n * np.eye(n)
-        x_true = np.random.normal(size=(n,))
+        A = _random_diagonally_dominant_spd_matrix(rng, n)
+        x_true = rng.normal(size=(n,))
         b = A @ x_true
 
         for matblinsolve in self.matblinsolvers:
-            with self.subTest():
+            with self.subTest(matblinsolve=matblinsolve.__name__):
                 x, _, _, info = matblinsolve(A=A, b=b)
                 self.assertAllClose(
                     x.mean,
@@ -189,17 +257,17 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
     def test_sparse_poisson(self):
         """(Sparse) linear system from Poisson PDE with boundary conditions."""
         A, f = self.poisson_linear_system
-        u = scipy.sparse.linalg.spsolve(A=A, b=f)
+        u = self.poisson_solution
 
         for plinsolve in self.problinsolvers:
-            with self.subTest():
+            with self.subTest(plinsolve=plinsolve.__name__):
                 u_solver, Ahat, Ainvhat, info = plinsolve(A=A, b=f)
                 self.assertAllClose(
                     u_solver.mean,
                     u,
                     rtol=1e-5,
                     msg="Solution from probabilistic linear solver does"
-                    + " not match scipy.sparse.linalg.spsolve.",
+                    + " not match a sparse direct solve.",
                 )
 
     def test_residual_matches_error(self):
@@ -207,7 +275,7 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
         A, b, x_true = self.rbf_kernel_linear_system
 
         for plinsolve in self.problinsolvers:
-            with self.subTest():
+            with self.subTest(plinsolve=plinsolve.__name__):
                 x_est, Ahat, Ainvhat, info = plinsolve(A=A, b=b)
                 self.assertAlmostEqual(
                     info["resid_l2norm"],
@@ -236,31 +304,37 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
         """
         A, b, x_true = self.rbf_kernel_linear_system
         n = A.shape[0]
+        maxiter = 10 * n
 
         for calibrate in [False, 0.0]:  # , 10 ** -6, 2.8]:
             # TODO (probnum#100) expand this test to the prior covariance class
             # admitting calibration
             with self.subTest():
-                # Define callback function to obtain search directions
-                S = []  # search directions
-                Y = []  # observations
+                # Define callback function to obtain search directions, stored
+                # row-wise in buffers sized by the maximum number of iterations
+                S_buf = np.empty((maxiter, n))  # search directions
+                Y_buf = np.empty((maxiter, n))  # observations
+                num_iter = 0
 
                 # pylint: disable=cell-var-from-loop
                 def callback_postparams(xk, Ak, Ainvk, sk, yk, alphak, resid):
-                    S.append(sk)
-                    Y.append(yk)
+                    nonlocal num_iter
+                    S_buf[num_iter] = sk.ravel()
+                    Y_buf[num_iter] = yk.ravel()
+                    num_iter += 1
 
                 # Solve linear system
                 u_solver, Ahat, Ainvhat, info = linalg.problinsolve(
                     A=A,
                     b=b,
                     assume_A="sympos",
+                    maxiter=maxiter,
                     callback=callback_postparams,
                     calibration=calibrate,
                 )
-                # Create arrays from lists
-                S = np.squeeze(np.array(S)).T
-                Y = np.squeeze(np.array(Y)).T
+                # Column views of the recorded search directions and observations
+                S = S_buf[:num_iter].T
+                Y = Y_buf[:num_iter].T
 
                 self.assertAllClose(
                     Ahat.cov.A @ S,
@@ -279,33 +353,34 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
         """Posterior covariances of the output must be positive (semi-) definite."""
         # Initialization
         A, f = self.poisson_linear_system
+        n = A.shape[0]
         eps = 10 ** -12
 
         for matblinsolve in self.matblinsolvers:
-            with self.subTest():
+            with self.subTest(matblinsolve=matblinsolve.__name__):
                 # Solve linear system
                 u_solver, Ahat, Ainvhat, info = matblinsolve(A=A, b=f)
 
                 # Check positive definiteness
                 self.assertArrayLess(
-                    np.zeros(np.shape(A)[0]),
+                    np.zeros(n),
                     np.real_if_close(np.linalg.eigvals(Ahat.cov.A.todense())) + eps,
                     msg="Covariance of A not positive semi-definite.",
                 )
                 self.assertArrayLess(
-                    np.zeros(np.shape(A)[0]),
+                    np.zeros(n),
                     np.real_if_close(np.linalg.eigvals(Ainvhat.cov.A.todense())) + eps,
                     msg="Covariance of Ainv not positive semi-definite.",
                 )
 
     def test_matrixprior(self):
         """Solve random linear system with a matrix-based linear solver."""
-        np.random.seed(1)
+        rng = np.random.default_rng(1)
         # Linear system
         n = 10
-        A = np.random.rand(n, n)
-        A = A.dot(A.T) + n * np.eye(n)  # Symmetrize and make diagonally dominant
-        x_true = np.random.normal(size=(n,))
+        A = rng.random((n, n))
+        A = A @ A.T + n * np.eye(n)  # Symmetrize and make diagonally dominant
+        x_true = rng.normal(size=(n,))
         b = A @ x_true
 
         # Prior distributions on A
@@ -313,8 +388,12 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
         Ainv0 = rvs.Normal(mean=np.eye(n), cov=covA)
 
         for matblinsolve in self.matblinsolvers:
-            with self.subTest():
-                x, Ahat, Ainvhat, info = matblinsolve(A=A, Ainv0=Ainv0, b=b)
+            with self.subTest(matblinsolve=matblinsolve.__name__):
+                # Stop well below the tolerance of the comparison, which would
+                # otherwise coincide with the default residual tolerance of 1e-6
+                x, Ahat, Ainvhat, info = matblinsolve(
+                    A=A, Ainv0=Ainv0, b=b, atol=1e-10, rtol=1e-10
+                )
 
                 self.assertAllClose(
                     x.mean,
@@ -326,28 +405,35 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
 
     def test_searchdir_conjugacy(self):
         """Search directions should remain A-conjugate up to machine precision, i.e. s_i^T A s_j = 0 for i != j."""
-        searchdirs = []
-
-        # Define callback function to obtain search directions
-        def callback_searchdirs(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
-            searchdirs.append(sk)
-
         # Solve linear system
         A, f = self.poisson_linear_system
+        n = A.shape[0]
+        maxiter = 10 * n
 
         for plinsolve in self.problinsolvers:
-            with self.subTest():
-                plinsolve(A=A, b=f, callback=callback_searchdirs)
+            with self.subTest(plinsolve=plinsolve.__name__):
+                # Define callback function to obtain search directions
+                searchdirs = np.empty((maxiter, n))
+                num_iter = 0
 
-                # Compute pairwise inner products in A-space
-                search_dir_arr = np.squeeze(np.array(searchdirs)).T
-                inner_prods = search_dir_arr.T @ A @ search_dir_arr
+                # pylint: disable=cell-var-from-loop
+                def callback_searchdirs(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
+                    nonlocal num_iter
+                    searchdirs[num_iter] = sk.ravel()
+                    num_iter += 1
 
-                # Compare against identity matrix
-                self.assertAllClose(
-                    np.diag(np.diag(inner_prods)),
-                    inner_prods,
-                    atol=1e-7,
+                plinsolve(A=A, b=f, maxiter=maxiter, callback=callback_searchdirs)
+
+                # Compute pairwise inner products in A-space, applying the sparse
+                # matrix to the search directions first
+                search_dir_arr = searchdirs[:num_iter].T
+                inner_prods = search_dir_arr.T @ (A @ search_dir_arr)
+
+                # Off-diagonal inner products must vanish
+                np.fill_diagonal(inner_prods, 0.0)
+                self.assertLessEqual(
+                    np.max(np.abs(inner_prods)),
+                    1e-7,
                     msg="Search directions from solver are not A-conjugate.",
                 )
 
@@ -359,45 +445,36 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
 
         # Linear system
         A, b = self.poisson_linear_system
-
-        # Callback function to return CG iterates
-        cg_iterates = []
-
-        def callback_iterates_CG(xk):
-            cg_iterates.append(
-                np.eye(np.shape(A)[0]) @ xk
-            )  # identity hack to actually save different iterations
-
-        # Solve linear system
-
-        # Initial guess as chosen by PLS: x0 = Ainv.mean @ b
-        x0 = b
+        n = A.shape[0]
 
         # Conjugate gradient method
-        xhat_cg, info_cg = scipy.sparse.linalg.cg(
-            A=A, b=b, x0=x0, tol=10 ** -6, callback=callback_iterates_CG
-        )
-        cg_iters_arr = np.array([x0] + cg_iterates)
+        xhat_cg = self.poisson_cg_solution
+        cg_iters_arr = self.poisson_cg_iterates
 
         # Matrix priors (encoding weak symmetric posterior correspondence)
         Ainv0 = rvs.Normal(
-            mean=linops.Identity(A.shape[1]),
-            cov=linops.SymmetricKronecker(A=linops.Identity(A.shape[1])),
+            mean=linops.Identity(n),
+            cov=linops.SymmetricKronecker(A=linops.Identity(n)),
         )
         A0 = rvs.Normal(
-            mean=linops.Identity(A.shape[1]),
+            mean=linops.Identity(n),
             cov=linops.SymmetricKronecker(A),
         )
-        for kwargs in [{"assume_A": "sympos", "rtol": 10 ** -6}]:
-            with self.subTest():
-                # Define callback function to obtain search directions
-                pls_iterates = []
+        # Define callback function to obtain the iterates, preceded by the initial
+        # guess, into a buffer shared by all solver configurations
+        maxiter = 10 * n
+        pls_iterates = np.empty((maxiter + 1, n))
+        pls_iterates[0] = b
+        num_iter = 1
+
+        def callback_iterates_PLS(xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs):
+            nonlocal num_iter
+            pls_iterates[num_iter] = xk.mean.ravel()
+            num_iter += 1
 
-                # pylint: disable=cell-var-from-loop
-                def callback_iterates_PLS(
-                    xk, Ak, Ainvk, sk, yk, alphak, resid, **kwargs
-                ):
-                    pls_iterates.append(xk.mean)
+        for kwargs in [{"assume_A": "sympos", "rtol": 10 ** -6}]:
+            with self.subTest(**kwargs):
+                num_iter = 1
 
                 # Probabilistic linear solver
                 xhat_pls, _, _, info_pls = linalg.problinsolve(
@@ -405,10 +482,11 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                     b=b,
                     Ainv0=Ainv0,
                     A0=A0,
+                    maxiter=maxiter,
                     callback=callback_iterates_PLS,
                     **kwargs
                 )
-                pls_iters_arr = np.array([x0] + pls_iterates)
+                pls_iters_arr = pls_iterates[:num_iter]
 
                 self.assertAllClose(xhat_pls.mean, xhat_cg, rtol=10 ** -12)
                 self.assertAllClose(pls_iters_arr, cg_iters_arr, rtol=10 ** -12)
@@ -422,7 +500,7 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
         A, b, x_true = self.rbf_kernel_linear_system
 
         for calib_method in [None, 0, 1.0, "adhoc", "weightedmean", "gpkern"]:
-            with self.subTest():
+            with self.subTest(calibration=calib_method):
                 x_est, Ahat, Ainvhat, info = linalg.problinsolve(
                     A=A, b=b, calibration=calib_method
                 )
@@ -432,13 +510,30 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                     msg="Iteratively computed trace not equal to trace of solution covariance.",
                 )
 
+    def test_iterative_covariance_trace_update_solution_guess(self):
+        """The iteratively computed trace of the solution covariance is correct for a
+        calibrated prior whose mean is constructed from a solution guess."""
+        A, b, x_true = self.rbf_kernel_linear_system
+        x0 = np.random.default_rng(1).normal(size=x_true.shape)
+
+        # Stop early, such that the solution covariance is not negligible
+        x_est, Ahat, Ainvhat, info = linalg.problinsolve(
+            A=A, b=b, x0=x0, calibration=1.0, maxiter=5
+        )
+        self.assertAllClose(
+            info["trace_sol_cov"],
+            x_est.cov.trace(),
+            rtol=1e-8,
+            msg="Iteratively computed trace not equal to trace of solution covariance.",
+        )
+
     def test_uncertainty_calibration_error(self):
         """Test if the available uncertainty calibration procedures affect the error of the returned solution."""
         tol = 10 ** -6
         A, b, x_true = self.rbf_kernel_linear_system
 
         for calib_method in [None, 0, "adhoc", "weightedmean", "gpkern"]:
-            with self.subTest():
+            with self.subTest(calibration=calib_method):
                 x_est, Ahat, Ainvhat, info = linalg.problinsolve(
                     A=A, b=b, calibration=calib_method
                 )
@@ -449,49 +544,39 @@ class LinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                 )
 
 
-class MatrixBasedLinearSolverTestCase(unittest.TestCase, NumpyAssertions):
+class MatrixBasedLinearSolverTestCase(
+    _PoissonLinearSystemMixin, unittest.TestCase, NumpyAssertions
+):
     """Tests the matrix-based probabilistic linear solver."""
 
-    def setUp(self):
-        """Resources for tests."""
-
-        # Poisson equation with Dirichlet conditions.
-        #
-        #   - Laplace(u) = f    in the interior
-        #              u = u_D  on the boundary
-        # where
-        #     u_D = 1 + x^2 + 2y^2
-        #     f = -4
-        #
-        # Linear system resulting from discretization on an elliptic grid.
-        fpath = os.path.join(os.path.dirname(__file__), "../../resources")
-        A = scipy.sparse.load_npz(file=fpath + "/matrix_poisson.npz")
-        f = np.load(file=fpath + "/rhs_poisson.npy")
-        self.poisson_linear_system = A, f
+    def assertPositiveDefinite(self, M, msg=None):
+        """Assert that a symmetric matrix is positive definite, i.e. admits a Cholesky
+        factorization."""
+        try:
+            scipy.linalg.cholesky(M)
+        except (np.linalg.LinAlgError, ValueError):
+            # `ValueError` is raised for matrices with non-finite entries
+            self.fail(msg or "Matrix is not positive definite.")
 
     def test_prior_distribution_from_solution_guess(self):
         """
         When constructing prior means for A and H from a guess for the solution x0, then A_0 and H_0 should be symmetric
         positive definite, inverses of each other and x0=Hb should hold.
         """
-        for seed in range(0, 10):
+        # Linear system
+        A, b = self.poisson_linear_system
+        b = b[:, np.newaxis]
+
+        # Solution guesses and the guesses the prior means must reproduce, which are
+        # flipped to have a positive inner product with b (or zero if orthogonal)
+        X0 = np.random.default_rng(42).standard_normal((len(b), 10))
+        X0_true = X0 * np.sign(b.T @ X0)
+
+        # Matrix-based solver
+        smbs = linalg.MatrixBasedSolver(A=A, b=b)
+
+        for x0, x0_true in zip(X0.T[:, :, np.newaxis], X0_true.T[:, :, np.newaxis]):
             with self.subTest():
-                np.random.seed(seed)
-
-                # Linear system
-                A, b = self.poisson_linear_system
-                b = b[:, np.newaxis]
-                x0 = np.random.randn(len(b))[:, np.newaxis]
-
-                if x0.T @ b < 0:
-                    x0_true = -x0
-                elif x0.T @ b == 0:
-                    x0_true = np.zeros_like(b)
-                else:
-                    x0_true = x0
-
-                # Matrix-based solver
-                smbs = linalg.MatrixBasedSolver(A=A, b=b, x0=x0)
                 A0_mean, Ainv0_mean = smbs._construct_symmetric_matrix_prior_means(
                     A=A, b=b, x0=x0
                 )
@@ -503,8 +588,8 @@ class MatrixBasedLinearSolverTestCase(unittest.TestCase, NumpyAssertions):
 
                 # Inverse correspondence
                 self.assertAllClose(
-                    A0_mean @ Ainv0_mean @ np.eye(np.shape(A)[0]),
-                    np.eye(np.shape(A)[0]),
+                    A0_mean @ Ainv0_mean_dense,
+                    np.eye(A.shape[0]),
                     atol=10 ** -8,
                     rtol=10 ** -8,
                 )
@@ -514,5 +599,5 @@ class MatrixBasedLinearSolverTestCase(unittest.TestCase, NumpyAssertions):
                 self.assertAllClose(A0_mean_dense, A0_mean_dense.T)
 
                 # Positive definiteness
-                self.assertTrue(np.all(np.linalg.eigvals(Ainv0_mean_dense) > 0))
-                self.assertTrue(np.all(np.linalg.eigvals(A0_mean_dense) > 0))
+                self.assertPositiveDefinite(Ainv0_mean_dense)
+                self.assertPositiveDefinite(A0_mean_dense)
@@ -170,6 +170,12 @@ class LinearOperatorFunctionsTestCase(LinearOperatorTestCase):
                     A.trace(), np.trace(A.todense()).item(), significant=7
                 )
 
+    def test_diagonal_dense(self):
+        """Check whether the diagonal matches the diagonal of the dense representation."""
+        for A in self.ops + [2.5 * linops.Identity(shape=3), self.ops[0].T]:
+            with self.subTest():
+                self.assertAllClose(A.diagonal(), np.diag(A.todense()))
+
     def test_adjoint(self):
         pass
 
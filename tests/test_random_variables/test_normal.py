@@ -129,6 +129,17 @@ class NormalTestCase(unittest.TestCase, NumpyAssertions):
                 else:
                     self.assertIsInstance(normrv, rvs.Dirac)
 
+    def test_scalarmult_overflow(self):
+        """Multiplication and division by scalars which overflow the covariance yield
+        infinite variances instead of raising."""
+        rv = rvs.Normal(mean=np.zeros(2), cov=np.eye(2))
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            scaled_rvs = [1e200 * rv, rv * 1e200, rv / 1e-200]
+
+        for scaled_rv in scaled_rvs:
+            with self.subTest():
+                self.assertTrue(np.all(np.isinf(scaled_rv.var)))
+
     def test_addition_normal(self):
         """Add two random variables with a normal distribution"""
         for (mean0, cov0), (mean1, cov1) in list(
@@ -215,6 +226,14 @@ class NormalTestCase(unittest.TestCase, NumpyAssertions):
                 else:
                     self.assertAllClose(rv_sample, rv.mean, msg=assert_str)
 
+    def test_sample_small_cov(self):
+        """Samples from a distribution with a covariance on the scale of the Cholesky
+        damping have the correct standard deviation."""
+        rv = rvs.Normal(mean=np.zeros(2), cov=1e-14 * np.eye(2), random_state=1)
+        samples = rv.sample(size=10000)
+
+        self.assertAllClose(np.std(samples, axis=0), rv.std, rtol=5e-2)
+
     def test_symmetric_samples(self):
         """Samples from a normal distribution with symmetric Kronecker kernels of two symmetric matrices are
         symmetric."""
@@ -492,6 +511,97 @@ class MultivariateNormalTestCase(unittest.TestCase, NumpyAssertions):
 
         self.assertArrayEqual(dist_t_sample, dist_sample)
 
+    def test_logpdf_matches_scipy(self):
+        """The (log-)density agrees with scipy for single and batched inputs."""
+        rv = rvs.Normal(*self.params)
+        for x in [np.random.normal(size=10), np.random.normal(size=(3, 2, 10))]:
+            with self.subTest():
+                logpdf = scipy.stats.multivariate_normal.logpdf(x, *self.params)
+
+                self.assertAllClose(rv.logpdf(x), logpdf, rtol=1e-10)
+                self.assertAllClose(rv.pdf(x), np.exp(logpdf), rtol=1e-10)
+
+    def test_logpdf_small_cov_matches_scipy(self):
+        """The (log-)density of a covariance on the scale of the Cholesky damping
+        agrees with scipy."""
+        mean, cov = np.zeros(2), 1e-14 * np.eye(2)
+        rv = rvs.Normal(mean=mean, cov=cov)
+        x = np.array([1e-7, -1e-7])
+        logpdf = scipy.stats.multivariate_normal.logpdf(x, mean, cov)
+
+        self.assertAllClose(rv.logpdf(x), logpdf, rtol=1e-10)
+        self.assertAllClose(rv.pdf(x), np.exp(logpdf), rtol=1e-10)
+
+    def test_shift_reuses_cov_cholesky(self):
+        """Shifting by a constant keeps the covariance and its Cholesky factor."""
+        rv = rvs.Normal(*self.params)
+        shift = np.random.normal(size=10)
+        cov_cholesky = rv.cov_cholesky
+
+        for shifted_rv, mean in [
+            (rv + rvs.Dirac(shift), self.params[0] + shift),
+            (rvs.Dirac(shift) - rv, shift - self.params[0]),
+            (-rv, -self.params[0]),
+        ]:
+            with self.subTest():
+                self.assertAllClose(shifted_rv.mean, mean)
+                self.assertArrayEqual(shifted_rv.cov, rv.cov)
+                self.assertIs(shifted_rv.cov_cholesky, cov_cholesky)
+
+    def test_matmul_structured_support(self):
+        """Linear transformations by vectors, diagonal and sparse matrices agree with
+        the dense computation."""
+        mean, cov = self.params
+        rv = rvs.Normal(mean, cov)
+        A_dense = np.random.normal(size=(3, 10))
+
+        for A in [
+            np.random.normal(size=10),
+            np.diag(np.random.normal(size=10)),
+            scipy.sparse.random(4, 10, density=0.3, format="csr", random_state=1),
+            A_dense,
+        ]:
+            with self.subTest():
+                A_arr = A.toarray() if scipy.sparse.issparse(A) else A
+                transformed_rv = rvs.Dirac(A) @ rv
+
+                self.assertAllClose(transformed_rv.mean, A_arr @ mean)
+                self.assertAllClose(transformed_rv.cov, A_arr @ cov @ A_arr.T)
+
+    def test_cov_cholesky_propagation(self):
+        """Scaling and linear transformations propagate a known Cholesky factor."""
+        mean, cov = self.params
+        rv = rvs.Normal(mean, cov, cov_cholesky=np.linalg.cholesky(cov))
+        A = np.random.normal(size=(3, 10))
+
+        D = np.diag(np.random.normal(size=10))
+
+        for transformed_rv in [
+            -2.5 * rv,
+            rv / 4.0,
+            rvs.Dirac(A) @ rv,
+            rvs.Dirac(D) @ rv,
+        ]:
+            with self.subTest():
+                cov_cholesky = transformed_rv.cov_cholesky
+
+                self.assertAllClose(np.triu(cov_cholesky, k=1), 0.0)
+                self.assertTrue(np.all(np.diag(cov_cholesky) >= 0))
+                self.assertAllClose(
+                    cov_cholesky @ cov_cholesky.T, transformed_rv.cov, rtol=1e-10
+                )
+
+    def test_sample_moments(self):
+        """Empirical moments of samples match the parameters of the distribution."""
+        np.random.seed(42)
+        rv = rvs.Normal(
+            mean=np.random.uniform(size=10), cov=_random_spd_matrix(10), random_state=1
+        )
+        samples = rv.sample(size=100000)
+
+        self.assertAllClose(np.mean(samples, axis=0), rv.mean, atol=1e-1)
+        self.assertAllClose(np.cov(samples, rowvar=False), rv.cov, rtol=5e-2, atol=5e-1)
+
 
 class MatrixvariateNormalTestCase(unittest.TestCase, NumpyAssertions):
     def test_reshape(self):
@@ -519,6 +629,86 @@ class MatrixvariateNormalTestCase(unittest.TestCase, NumpyAssertions):
             dist_reshape_sample, dist_sample.reshape((-1,) + newshape)
         )
 
+    def test_kronecker_sample_moments(self):
+        """Samples with Kronecker covariance have the moments of the dense equivalent."""
+        np.random.seed(42)
+        cov = linops.Kronecker(A=_random_spd_matrix(3), B=_random_spd_matrix(2))
+        rv = rvs.Normal(mean=np.random.uniform(size=(3, 2)), cov=cov, random_state=1)
+        samples = rv.sample(size=100000).reshape(-1, 6)
+
+        self.assertAllClose(np.mean(samples, axis=0), rv.mean.ravel(), atol=1e-1)
+        self.assertAllClose(
+            np.cov(samples, rowvar=False), cov.todense(), rtol=5e-2, atol=5e-1
+        )
+
+    def test_kronecker_sample_small_cov(self):
+        """Samples with a Kronecker covariance on the scale of the Cholesky damping have
+        the correct standard deviation."""
+        for cov in [
+            linops.Kronecker(A=1e-7 * np.eye(2), B=1e-7 * np.eye(3)),
+            linops.Kronecker(
+                A=np.eye(2), B=linops.ScalarMult(shape=(3, 3), scalar=1e-14)
+            ),
+        ]:
+            with self.subTest():
+                rv = rvs.Normal(mean=np.zeros((2, 3)), cov=cov, random_state=1)
+                samples = rv.sample(size=10000)
+
+                self.assertAllClose(np.std(samples, axis=0), rv.std, rtol=5e-2)
+
+    def test_scalar_kronecker_factor_cholesky(self):
+        """Kronecker factors which are scalar multiples of the identity have a
+        structured Cholesky factor."""
+        A = _random_spd_matrix(3)
+        for cov in [
+            linops.Kronecker(A=A, B=linops.ScalarMult(shape=(2, 2), scalar=2.0)),
+            linops.SymmetricKronecker(A=linops.Identity(shape=3)),
+        ]:
+            with self.subTest():
+                shape = (cov.A.shape[0], cov.B.shape[0])
+                rv = rvs.Normal(mean=np.zeros(shape), cov=cov, random_state=1)
+
+                self.assertIsInstance(rv.cov_cholesky.B, linops.ScalarMult)
+                self.assertAllClose(
+                    rv.cov_cholesky.todense() @ rv.cov_cholesky.todense().T,
+                    cov.todense(),
+                    atol=1e-10,
+                )
+                self.assertEqual(rv.sample(size=4).shape, (4,) + shape)
+
+    def test_indefinite_scalar_kronecker_factor_cholesky(self):
+        """The Cholesky factor of a covariance with a scalar Kronecker factor which is
+        not positive definite does not exist."""
+        rv = rvs.Normal(
+            mean=np.zeros((2, 2)),
+            cov=linops.Kronecker(
+                A=np.eye(2), B=linops.ScalarMult(shape=(2, 2), scalar=-1.0)
+            ),
+        )
+
+        with self.assertRaises(np.linalg.LinAlgError):
+            rv.cov_cholesky
+
+    def test_matmul_dirac(self):
+        """Right multiplication with a constant matrix transforms the covariance
+        consistently with the row-major vectorization."""
+        A = np.random.normal(size=(2, 4))
+        cov_update = np.kron(np.eye(3), A.T)
+
+        for cov in [
+            _random_spd_matrix(6),
+            linops.Kronecker(A=_random_spd_matrix(3), B=_random_spd_matrix(2)),
+        ]:
+            with self.subTest():
+                rv = rvs.Normal(mean=np.random.uniform(size=(3, 2)), cov=cov)
+                transformed_rv = rv @ rvs.Dirac(A)
+                dense_cov = cov.todense() if isinstance(cov, linops.Kronecker) else cov
+
+                self.assertAllClose(transformed_rv.mean, rv.mean @ A)
+                self.assertAllClose(
+                    transformed_rv.dense_cov, cov_update @ dense_cov @ cov_update.T
+                )
+
     def test_transpose(self):
         rv = rvs.Normal(mean=np.random.uniform(size=(2, 2)), cov=_random_spd_matrix(4))
         transposed_rv = rv.transpose()
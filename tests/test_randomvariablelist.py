@@ -3,7 +3,7 @@ import unittest
 import numpy as np
 
 from probnum._randomvariablelist import _RandomVariableList
-from probnum.random_variables import Dirac
+from probnum.random_variables import Dirac, Normal
 
 
 class TestRandomVariableList(unittest.TestCase):
@@ -43,10 +43,58 @@ class TestRandomVariableList(unittest.TestCase):
         std = self.rv_list.std
         self.assertEqual(std.shape, (2,))
 
+    def test_multivariate_moments(self):
+        """Moments of vector-valued random variables are stacked along axis 0."""
+        means = [np.arange(3.0), 2.0 * np.arange(3.0)]
+        covs = [np.eye(3), 2.0 * np.eye(3)]
+        rv_list = _RandomVariableList(
+            [Normal(mean=m, cov=c) for m, c in zip(means, covs)]
+        )
+        np.testing.assert_allclose(rv_list.mean, np.stack(means))
+        np.testing.assert_allclose(rv_list.cov, np.stack(covs))
+        np.testing.assert_allclose(rv_list.var, np.stack([np.diag(c) for c in covs]))
+        np.testing.assert_allclose(rv_list.std, np.sqrt(rv_list.var))
+
+    def test_shared_moment_not_copied(self):
+        """A moment shared by all random variables is broadcast instead of copied."""
+        cov = np.eye(3)
+        rv = Normal(mean=np.zeros(3), cov=cov)
+        rv_list = _RandomVariableList([rv, rv + Dirac(np.ones(3)), rv])
+        self.assertEqual(rv_list.cov.shape, (3, 3, 3))
+        self.assertTrue(np.shares_memory(rv_list.cov, rv.cov))
+        np.testing.assert_allclose(rv_list.cov, np.stack([cov] * 3))
+        self.assertFalse(rv_list.cov.flags.writeable)
+        np.testing.assert_allclose(rv_list.std, np.ones((3, 3)))
+        self.assertFalse(rv_list.std.flags.writeable)
+
+    def test_moments_shape_mismatch(self):
+        """Moments of random variables with different shapes cannot be stacked."""
+        rv_list = _RandomVariableList(
+            [Normal(mean=np.zeros(3), cov=np.eye(3)), Normal(np.zeros(1), np.eye(1))]
+        )
+        with self.assertRaises(ValueError):
+            rv_list.mean
+
+    def test_moments_cached(self):
+        """Repeated access returns the cached moments until the list is mutated."""
+        mean = self.rv_list.mean
+        self.assertIs(self.rv_list.mean, mean)
+
+        self.rv_list.append(Dirac(0.3))
+        self.assertEqual(self.rv_list.mean.shape, (3,))
+
+        self.rv_list[0] = Dirac(1.0)
+        self.assertEqual(self.rv_list.mean[0], 1.0)
+
     def test_getitem(self):
         item = self.rv_list[0]
         self.assertIsInstance(item, Dirac)
 
+    def test_getitem_slice(self):
+        sliced = self.rv_list[:1]
+        self.assertIsInstance(sliced, _RandomVariableList)
+        self.assertEqual(sliced.mean.shape, (1,))
+
 
 if __name__ == "__main__":
     unittest.main()